@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-from typing import Any, List, Optional, Generator
+from typing import Any, List, Literal, Optional, Generator
 
 from pydantic import Field, BaseModel, PrivateAttr, model_validator
 from botocore.config import Config
@@ -14,6 +14,14 @@ from rhubarb.system_prompts import SystemPrompts
 
 logger = logging.getLogger(__name__)
 
+_MESSAGES_API_MODELS = frozenset(
+    {
+        LanguageModels.CLAUDE_HAIKU_V1,
+        LanguageModels.CLAUDE_SONNET_V1,
+        LanguageModels.CLAUDE_SONNET_V2,
+    }
+)
+
 
 class DocAnalysis(BaseModel):
     """
@@ -28,6 +36,9 @@ class DocAnalysis(BaseModel):
     - `temperature` (int, optional): Amount of randomness injected into the response. Ranges from 0.0 to 1.0. Defaults to 0.
     - `pages` (List[int], optional): Pages of a multi-page PDF or TIF to process. [0] will process all pages upto 20 pages max,
     [1,3,5] will process pages 1, 3 and 5. Defaults to [0].
+    - `image_format` (str, optional): Image format the pages of PDF, TIFF and Word documents are sent to the model as,
+    "PNG" or "JPEG". JPEG and PNG files are sent as is. JPEG payloads are smaller and faster to produce for scanned
+    documents. Defaults to "PNG".
 
     Attributes:
     - `bedrock_client` (Optional[Any]): boto3 bedrock-runtime client, will get overriten by boto3_session.
@@ -73,9 +84,16 @@ class DocAnalysis(BaseModel):
     - [1,3,5] will process pages 1, 3 and 5
     """
 
+    image_format: Literal["PNG", "JPEG"] = Field(default="PNG")
+    """Image format the rendered pages of PDF, TIFF and Word documents are sent to the model as"""
+
     _message_history: List[Any] = PrivateAttr(default=None)
     """History of user/assistant messages"""
 
+    _page_cache: dict = PrivateAttr(default_factory=dict)
+    """Base64 pages of the document, converted once and reused by every call. The pages are
+    held for the lifetime of the instance, only the latest pages and image format are kept"""
+
     _bedrock_client: Any = PrivateAttr(default=None)
     """boto3 bedrock-runtime client, will get overriten by boto3_session"""
 
@@ -101,15 +119,19 @@ class DocAnalysis(BaseModel):
             logger.error("file_path must be a local file system path or an s3:// path")
             raise ValueError("file_path must be a local file system path or an s3:// path")
 
+        return values
+
+    @model_validator(mode="after")
+    def create_clients(self) -> "DocAnalysis":
         s3_config = Config(
             retries={"max_attempts": 0, "mode": "standard"}, signature_version="s3v4"
         )
         br_config = Config(retries={"max_attempts": 0, "mode": "standard"})
-        session = values.get("boto3_session")
-        cls._s3_client = session.client("s3", config=s3_config)
-        cls._bedrock_client = session.client("bedrock-runtime", config=br_config)
-
-        return values
+        # building a client is costly and the S3 client only serves documents stored in S3
+        if self.file_path.startswith("s3://"):
+            self._s3_client = self.boto3_session.client("s3", config=s3_config)
+        self._bedrock_client = self.boto3_session.client("bedrock-runtime", config=br_config)
+        return self
 
     @property
     def history(self) -> Any:
@@ -132,6 +154,8 @@ class DocAnalysis(BaseModel):
             temperature=self.temperature,
             pages=self.pages,
             message_history=history,
+            image_format=self.image_format,
+            page_cache=self._page_cache,
         )
 
     def run(
@@ -147,11 +171,7 @@ class DocAnalysis(BaseModel):
         - `message` (`str`): The input message or prompt for the language model.
         - `output_schema` (`Optional[dict]`, optional): The output JSON schema for the language model response. Defaults to None.
         """
-        if (
-            self.modelId == LanguageModels.CLAUDE_HAIKU_V1
-            or self.modelId == LanguageModels.CLAUDE_SONNET_V1
-            or self.modelId == LanguageModels.CLAUDE_SONNET_V2
-        ):
+        if self.modelId in _MESSAGES_API_MODELS:
             a_msg = self._get_anthropic_prompt(
                 message=message,
                 output_schema=output_schema,
@@ -179,11 +199,7 @@ class DocAnalysis(BaseModel):
         Args:
         - `message` (`Any`): The input message or prompt for the language model.
         """
-        if (
-            self.modelId == LanguageModels.CLAUDE_HAIKU_V1
-            or self.modelId == LanguageModels.CLAUDE_SONNET_V1
-            or self.modelId == LanguageModels.CLAUDE_SONNET_V2
-        ):
+        if self.modelId in _MESSAGES_API_MODELS:
             a_msg = self._get_anthropic_prompt(
                 message=message, sys_prompt=self.system_prompt, history=history
             )
@@ -204,11 +220,7 @@ class DocAnalysis(BaseModel):
         - `message` (`Any`): The input message or prompt for the language model.
         - `entities` (`List[Entities.entity]`): A list of entities to be detected
         """
-        if (
-            self.modelId == LanguageModels.CLAUDE_HAIKU_V1
-            or self.modelId == LanguageModels.CLAUDE_SONNET_V1
-            or self.modelId == LanguageModels.CLAUDE_SONNET_V2
-        ):
+        if self.modelId in _MESSAGES_API_MODELS:
             sys_prompt = SystemPrompts(entities=entities).NERSysPrompt
             a_msg = self._get_anthropic_prompt(message=message, sys_prompt=sys_prompt)
             body = a_msg.messages()
@@ -228,11 +240,7 @@ class DocAnalysis(BaseModel):
         - `message` (`Any`): The input message or prompt for the language model.
         - `assistive_rephrase` (`bool`): If set to true, will rephrase the question properly for subsequent use
         """
-        if (
-            self.modelId == LanguageModels.CLAUDE_HAIKU_V1
-            or self.modelId == LanguageModels.CLAUDE_SONNET_V1
-            or self.modelId == LanguageModels.CLAUDE_SONNET_V2
-        ):
+        if self.modelId in _MESSAGES_API_MODELS:
             if assistive_rephrase:
                 sys_prompt = SystemPrompts().SchemaGenSysPromptWithRephrase
             else:
@@ -3,11 +3,11 @@
 
 import io
 import logging
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Iterable
+from itertools import chain, islice
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from pydantic import Field, BaseModel, StrictInt, PrivateAttr, StrictFloat, model_validator
-from fastparquet import ParquetFile
 from botocore.config import Config
 
 from rhubarb.config import GlobalConfig
@@ -102,16 +102,6 @@ class Classification(BaseModel):
                 raise e
         return values
 
-    def _convert_to_base64(self, pages: List[int]) -> List[Dict[str, Any]]:
-        """
-        Converts page images to Base64 strings
-
-        Returns:
-            List[Dict[str, Any]]: A list of dictionaries containing the base64 string of pages.
-        """
-        converter = FileConverter(file_path=self.file_path, pages=pages, s3_client=self._s3_client)
-        return converter.convert_to_base64()
-
     def _gen_embedding(self, body: Any) -> List[Any]:
         """
         Bedrock Embdedding model API call
@@ -124,9 +114,13 @@ class Classification(BaseModel):
         )
         return model_invoke.invoke_embedding()
 
-    def _gen_embeddings_for_pages(self, base64_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _gen_embeddings_for_pages(
+        self, base64_list: Iterable[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
         """
-        Bulk Bedrock Embdedding model API call for all classes and their samples
+        Bulk Bedrock Embdedding model API call for all classes and their samples. Pages are
+        submitted as `base64_list` yields them, so an iterator of pages being rendered
+        overlaps rendering with the embedding calls.
 
         Returns:
             None
@@ -157,6 +151,8 @@ class Classification(BaseModel):
         return page_embeddings, errors
 
     def _get_sample_embeddings_v2(self) -> dict:
+        from fastparquet import ParquetFile
+
         config = GlobalConfig.get_instance()
         file_key = (
             f"{config.classification_prefix}/{self.classifier_id}/{self.classifier_id}.parquet"
@@ -284,9 +280,20 @@ class Classification(BaseModel):
         return result
 
     def classify_doc(self) -> dict:
-        base64_list = self._convert_to_base64(pages=self.pages)
-        page_embeddings, errors = self._gen_embeddings_for_pages(base64_list=base64_list)
-        samples = self._get_sample_embeddings_v2()
+        with FileConverter(
+            file_path=self.file_path, pages=self.pages, s3_client=self._s3_client
+        ) as converter:
+            pages = converter.iter_base64()
+            # render the first page before the samples thread starts, so a render process pool
+            # forks its workers while no other thread can be holding locks inside boto3
+            first_page = list(islice(pages, 1))
+            # the classifier samples are fetched from S3 while the pages are rendered and embedded
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                samples_future = executor.submit(self._get_sample_embeddings_v2)
+                page_embeddings, errors = self._gen_embeddings_for_pages(
+                    base64_list=chain(first_page, pages)
+                )
+                samples = samples_future.result()
 
         results = []
         for page in page_embeddings:
@@ -12,8 +12,6 @@ import tempfile
 from typing import Any, Dict, List, Tuple, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import pandas as pd
-
 from rhubarb.config import GlobalConfig
 from rhubarb.invocations import Invocations
 from rhubarb.file_converter import FileConverter
@@ -127,6 +125,8 @@ class VectorSampler:
                 classifiers.append(data["classifier"])
                 vectors_list.append(vector)
 
+        import pandas as pd
+
         # Create DataFrame
         df = pd.DataFrame({"classifier": classifiers, "class": keys, "vector": vectors_list})
 
@@ -216,8 +216,10 @@ class VectorSampler:
         Returns:
             List[Dict[str, Any]]: A list of dictionaries containing the base64 string of pages.
         """
-        converter = FileConverter(file_path=file_path, pages=[page], s3_client=self.s3_client)
-        return converter.convert_to_base64()
+        with FileConverter(
+            file_path=file_path, pages=[page], s3_client=self.s3_client
+        ) as converter:
+            return converter.convert_to_base64()
 
     def _batch_convert_to_base64(
         self, manifest_content: Dict[str, List[Tuple[str, int]]]
@@ -294,6 +296,8 @@ class VectorSampler:
             List[Dict[str, Any]]: A list of dictionaries containing class labels and sample counts
         """
 
+        import pandas as pd
+
         file_key = f"{self.config.classification_prefix}/{classifier_id}/{classifier_id}.parquet"
         try:
             self._check_valid_classifier(object_path=file_key)
@@ -11,6 +11,8 @@ class GlobalConfig(BaseModel):
     Attributes:
         max_retries (int): Maximum number of retries for API calls.
         initial_backoff (float): Initial backoff interval for retries, in seconds.
+        max_render_workers (int): Maximum number of workers used to render document pages.
+        max_download_workers (int): Maximum number of S3 documents downloaded concurrently.
     """
 
     max_retries: int = Field(
@@ -29,6 +31,16 @@ class GlobalConfig(BaseModel):
     classification_prefix: str = Field(
         default="rb_classification", description="Default Classification S3 prefix"
     )
+    max_render_workers: int = Field(
+        default=1,
+        gt=0,
+        description="Maximum number of workers used to render PDF pages and TIFF frames, 1 renders serially",
+    )
+    max_download_workers: int = Field(
+        default=8,
+        gt=0,
+        description="Maximum number of S3 documents downloaded concurrently by FileConverter.from_s3_prefix",
+    )
     
     @classmethod
     def update_config(cls, **kwargs):
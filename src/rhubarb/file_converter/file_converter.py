@@ -1,67 +1,544 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import os
+import mmap
 import base64
 import logging
-import mimetypes
+import weakref
+import tempfile
+import importlib.util
 from io import BytesIO
-from typing import Dict, List, Union, Optional
+from typing import Any, Dict, List, Tuple, Union, Literal, Iterator, Optional
+from functools import partial
+from itertools import islice
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 
 import boto3
-import pdfplumber
-from PIL import Image, ImageDraw
+import pypdfium2 as pdfium
+from PIL import Image, ImageDraw, ImageFont
+
+from rhubarb.config import GlobalConfig
+from rhubarb.utility import S3_TRANSFER_CONFIG
+
+from .image_validator import ImageValidator
+
+# python-docx is imported when a Word document is converted, it is only checked for here
+DOCX_AVAILABLE = importlib.util.find_spec("docx") is not None
 
 try:
-    from docx import Document
+    import pybase64
 
-    DOCX_AVAILABLE = True
+    PYBASE64_AVAILABLE = True
 except ImportError:
-    DOCX_AVAILABLE = False
-from .image_validator import ImageValidator
+    PYBASE64_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Supported file extensions and their MIME types
+_EXT_TO_MIME = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".pdf": "application/pdf",
+    ".tif": "image/tiff",
+    ".tiff": "image/tiff",
+    ".doc": "application/msword",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+
+def _stdlib_b64encode_string(data: bytes) -> str:
+    """
+    Base64 encode bytes into a string with the standard library codec.
+
+    Args:
+        data (bytes): The bytes to encode.
+
+    Returns:
+        str: The Base64 encoded string.
+    """
+    return base64.b64encode(data).decode("ascii")
+
+
+# Chosen once at import time, so every call is a direct call into the codec. pybase64
+# dispatches to the best SIMD implementation for the CPU (AVX2, NEON) on its own.
+_b64encode_string = pybase64.b64encode_as_string if PYBASE64_AVAILABLE else _stdlib_b64encode_string
+
+
+class _Base64Writer:
+    """
+    A write-only file-like object that Base64 encodes bytes as they are written.
+
+    Encoders such as PIL's `Image.save` write their output in small chunks, so feeding
+    them into this object means the full raw image never has to be held in memory
+    alongside its Base64 encoded copy. Complete 3-byte groups are encoded immediately
+    and any remainder is carried over to the next write.
+    """
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._tail = b""
+
+    def write(self, data: bytes) -> int:
+        size = len(data)
+        if self._tail:
+            data = self._tail + bytes(data)
+        cut = len(data) - len(data) % 3
+        if cut:
+            # slice through a memoryview so the chunk reaches the encoder without a copy
+            self._parts.append(_b64encode_string(memoryview(data)[:cut]))
+        self._tail = bytes(data[cut:])
+        return size
+
+    def flush(self) -> None:
+        pass
+
+    def getvalue(self) -> str:
+        """
+        Returns:
+            str: The Base64 encoded string of everything written so far.
+        """
+        if self._tail:
+            return "".join(self._parts) + _b64encode_string(self._tail)
+        return "".join(self._parts)
+
+
+def _image_to_base64(img: Image.Image, image_format: str = "PNG") -> str:
+    """
+    Encode a PIL image as PNG or JPEG directly into a Base64 string.
+
+    Args:
+        img (Image.Image): The image to encode.
+        image_format (str, optional): "PNG" or "JPEG". Defaults to "PNG".
+
+    Returns:
+        str: The Base64 encoded image.
+    """
+    writer = _Base64Writer()
+    if image_format == "JPEG":
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        img.save(writer, format="JPEG", quality=85, optimize=False, progressive=False)
+    else:
+        # the PNG is only an intermediate for the model, so favour encode speed over size
+        img.save(writer, format="PNG", compress_level=1, optimize=False)
+    return writer.getvalue()
+
+
+# Longest image side, in pixels, that Bedrock models keep before downscaling inputs
+MAX_PIXEL_DIM = 1568
+
+_worker_source: Any = None
+_worker_max_pixel_dim: int = MAX_PIXEL_DIM
+_worker_image_format: str = "PNG"
+_worker_pdf: Optional[pdfium.PdfDocument] = None
+
+
+def _init_render_worker(source: Any, max_pixel_dim: int, image_format: str) -> None:
+    """
+    Process pool initializer, hands the document source (a local path or the file
+    bytes) and render options to a render worker once instead of pickling them with
+    every page.
+    """
+    global _worker_source, _worker_max_pixel_dim, _worker_image_format, _worker_pdf
+    _worker_source = source
+    _worker_max_pixel_dim = max_pixel_dim
+    _worker_image_format = image_format
+    _worker_pdf = None
+
+
+def _open_source(source: Any) -> Any:
+    return BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+
+
+def _pdf_page_resolution(width: float, height: float, max_pixel_dim: int) -> int:
+    """
+    Pick the render DPI for a PDF page, at most 150 DPI, and lower for large pages so the
+    longest side does not exceed `max_pixel_dim` pixels. Pixels beyond that are discarded
+    by the model anyway but still cost PNG encoding, Base64 and transfer time.
+
+    Args:
+        width (float): The page width in points (1/72 inch).
+        height (float): The page height in points (1/72 inch).
+        max_pixel_dim (int): Maximum size of the longest side of the rendered image.
+
+    Returns:
+        int: The render resolution in DPI.
+    """
+    return max(1, min(150, int(max_pixel_dim * 72 / max(width, height))))
+
+
+def _render_pdf_page_image(
+    pdf: pdfium.PdfDocument, page_num: int, max_pixel_dim: int, image_format: str
+) -> str:
+    """
+    Rasterize a PDF page with PDFium and encode it into a Base64 string. The PIL image
+    wraps PDFium's RGB bitmap buffer directly, so the page is never copied in Python
+    before it is encoded.
+
+    Args:
+        pdf (pdfium.PdfDocument): The open PDF document.
+        page_num (int): Zero based index of the page.
+        max_pixel_dim (int): Maximum size of the longest side of the rendered image.
+        image_format (str): "PNG" or "JPEG".
+
+    Returns:
+        str: The Base64 encoded page image.
+    """
+    page = pdf[page_num]
+    try:
+        width, height = page.get_size()
+        scale = _pdf_page_resolution(width, height, max_pixel_dim) / 72
+        bitmap = page.render(scale=scale, rev_byteorder=True)
+        try:
+            return _image_to_base64(bitmap.to_pil(), image_format)
+        finally:
+            # release the page bitmap and parsed page right away instead of
+            # waiting for garbage collection, so memory stays bounded to one page
+            bitmap.close()
+    finally:
+        page.close()
+
+
+def _render_pdf_page(page_num: int) -> Tuple[int, str]:
+    """
+    Render a single PDF page in a worker process. The document is opened on the worker's
+    first page and kept open for the rest, so its cross-reference table and fonts are only
+    parsed once per worker. It is released when the pool shuts the worker down.
+
+    Args:
+        page_num (int): Zero based index of the page.
+
+    Returns:
+        Tuple[int, str]: The zero based page index and the Base64 encoded PNG.
+    """
+    global _worker_pdf
+    if _worker_pdf is None:
+        _worker_pdf = pdfium.PdfDocument(_worker_source)
+    return page_num, _render_pdf_page_image(
+        _worker_pdf, page_num, _worker_max_pixel_dim, _worker_image_format
+    )
+
+
+def _tiff_frame_count(img: Image.Image, limit: int) -> int:
+    """
+    Count the frames of a TIFF, stopping at `limit`. Pillow's `n_frames` walks the image
+    file directory of every frame, so a TIFF with thousands of frames would be read end to
+    end just to convert the first few.
+
+    Args:
+        img (Image.Image): The open TIFF image.
+        limit (int): The highest frame count of interest.
+
+    Returns:
+        int: The number of frames, or `limit` if the TIFF has at least that many.
+    """
+    # seek one frame at a time, after a seek past the end Pillow can report a wrong n_frames
+    count = 0
+    try:
+        while count < limit:
+            img.seek(count)
+            count += 1
+    except EOFError:
+        pass
+    finally:
+        img.seek(0)
+    return count
+
+
+def _encode_tiff_frame(source: Any, image_format: str, frame_num: int) -> Tuple[int, str]:
+    """
+    Open a TIFF, seek to a frame and encode it. Every call opens its own image, so frames
+    can be encoded on several threads at once.
+
+    Args:
+        source (Any): The TIFF path or bytes.
+        image_format (str): "PNG" or "JPEG".
+        frame_num (int): Zero based index of the frame.
+
+    Returns:
+        Tuple[int, str]: The zero based frame index and the Base64 encoded image.
+    """
+    with Image.open(_open_source(source)) as img:
+        img.seek(frame_num)
+        return frame_num, _image_to_base64(img, image_format)
+
+
+# Size and margin of the placeholder pages Word documents are drawn on
+_DOCX_PAGE_SIZE = (800, 600)
+_DOCX_MARGIN = 10
+
+
+def _iter_in_order(
+    executor: Executor, fn: Any, items: List[int], in_flight: int
+) -> Iterator[Tuple[int, str]]:
+    """
+    Map `fn` over `items` on `executor`, yielding results in order as they complete.
+
+    Only `in_flight` items are submitted ahead of the consumer, so rendered pages are
+    handed over as soon as they are ready instead of the whole selection being held in
+    memory. The executor is shut down once the results are consumed or abandoned.
+
+    Args:
+        executor (Executor): The executor to run `fn` on, owned by this generator.
+        fn (Callable): The function to apply to each item.
+        items (List[int]): The items to process.
+        in_flight (int): How many items may be submitted but not yet yielded.
+
+    Yields:
+        Tuple[int, str]: The result of `fn` for each item, in `items` order.
+    """
+    remaining = iter(items)
+    try:
+        pending = deque(executor.submit(fn, item) for item in islice(remaining, in_flight))
+        while pending:
+            result = pending.popleft().result()
+            for item in islice(remaining, 1):
+                pending.append(executor.submit(fn, item))
+            yield result
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _docx_line_height(font: Any) -> int:
+    # line advance of the tallest glyphs plus some leading
+    return font.getbbox("Ag")[3] + 4
+
+
+def _wrap_text(text: str, font: Any, max_width: int) -> List[str]:
+    """
+    Greedily word wrap text into lines no wider than `max_width` pixels. Line breaks in the
+    text are kept, and a word wider than a line gets a line of its own.
+    """
+    lines = []
+    for segment in text.replace("\t", "    ").split("\n"):
+        line = ""
+        for word in segment.split(" "):
+            candidate = f"{line} {word}" if line else word
+            if line and font.getlength(candidate) > max_width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    return lines
+
+
+def _docx_pages(document: Any, font: Any, limit: int) -> List[List[str]]:
+    """
+    Lay out the paragraphs of a Word document as lines of text on placeholder pages. A page
+    ends when it is full or at a hard page break, so the page count follows the length of
+    the document instead of its number of paragraphs. Layout stops after `limit` pages.
+
+    Args:
+        document (docx.document.Document): The open Word document.
+        font (ImageFont): The font the pages are drawn with.
+        limit (int): The highest page count of interest.
+
+    Returns:
+        List[List[str]]: The lines of text on each page, at most `limit` pages.
+    """
+    from docx.oxml.ns import qn
+
+    width, height = _DOCX_PAGE_SIZE
+    max_width = width - 2 * _DOCX_MARGIN
+    lines_per_page = max(1, (height - 2 * _DOCX_MARGIN) // _docx_line_height(font))
+    text_tags = (qn("w:t"), qn("w:tab"), qn("w:br"), qn("w:cr"))
+
+    pages = [[]]
+
+    def add_text(text: str) -> None:
+        for line in _wrap_text(text, font, max_width):
+            if len(pages[-1]) == lines_per_page:
+                pages.append([])
+            pages[-1].append(line)
+
+    for paragraph in document.paragraphs:
+        if len(pages) > limit:
+            break
+        text = ""
+        for element in paragraph._p.iter(*text_tags):
+            if element.tag == qn("w:t"):
+                text += element.text or ""
+            elif element.tag == qn("w:tab"):
+                text += "\t"
+            elif element.get(qn("w:type")) == "page":
+                if text:
+                    add_text(text)
+                    text = ""
+                pages.append([])
+            else:
+                text += "\n"
+        add_text(text)
+    return pages[:limit]
+
 
 class FileConverter:
-    def __init__(self, file_path: str, pages: List[int], s3_client: Optional[boto3.client]):
+    def __init__(
+        self,
+        file_path: str,
+        pages: List[int],
+        s3_client: Optional[boto3.client],
+        max_pixel_dim: int = MAX_PIXEL_DIM,
+        image_format: Literal["PNG", "JPEG"] = "PNG",
+    ):
         """
         Initialize the FileConverter object.
 
         Args:
             file_path (str): The path to the file (local or S3).
             s3_client (boto3.client, optional): The boto3 S3 client. Defaults to None.
+            max_pixel_dim (int, optional): Maximum size in pixels of the longest side of rendered
+                PDF pages. Defaults to 1568.
+            image_format (str, optional): Image format rendered pages are encoded as, "PNG" or
+                "JPEG". JPEG is faster to encode and much smaller for scanned pages. Defaults to "PNG".
         """
         self.file_path = file_path
         self.s3_client = s3_client
         self.pages = pages
-        self.file_bytes, self.mime_type = self._get_file_bytes_and_mime_type()
+        self.max_pixel_dim = max_pixel_dim
+        self.image_format = image_format
+        self.mime_type = self._get_mime_type()
+        self._is_s3 = file_path.startswith("s3://")
+        self._bucket, self._key = self._parse_s3_path(file_path) if self._is_s3 else (None, None)
+        self._file_bytes = None
+        self._tmp_path = None
+
+    @classmethod
+    def from_s3_prefix(
+        cls,
+        bucket: str,
+        prefix: str,
+        s3_client: boto3.client,
+        pages: Optional[List[int]] = None,
+    ) -> List["FileConverter"]:
+        """
+        Create a FileConverter for every supported document under an S3 prefix. The documents
+        are downloaded concurrently, each one into its converter's temporary file, so no
+        converter has to fetch its document when it is first used.
+
+        Args:
+            bucket (str): The S3 bucket name.
+            prefix (str): The key prefix to list documents under.
+            s3_client (boto3.client): The boto3 S3 client.
+            pages (List[int], optional): Pages to convert for each document. Defaults to [0].
+
+        Returns:
+            List[FileConverter]: One FileConverter per supported document.
+        """
+        pages = [0] if pages is None else pages
+        paginator = s3_client.get_paginator("list_objects_v2")
+        converters = []
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                if obj["Key"].endswith("/"):
+                    continue
+                file_path = f"s3://{bucket}/{obj['Key']}"
+                if os.path.splitext(file_path)[1].lower() not in _EXT_TO_MIME:
+                    logger.debug(f"Skipping unsupported file type: {file_path}")
+                    continue
+                converters.append(cls(file_path=file_path, pages=list(pages), s3_client=s3_client))
+
+        workers = min(len(converters), GlobalConfig.get_instance().max_download_workers)
+        if workers > 0:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # downloads stream to disk, so only `workers` transfers are in flight at once
+                list(executor.map(cls._get_source, converters))
+        return converters
+
+    @property
+    def media_type(self) -> str:
+        """
+        The media type of the Base64 images produced by `convert_to_base64`. JPEG and PNG
+        files are passed through as is, other documents are rendered in `image_format`.
+        """
+        if self.mime_type in ("image/jpeg", "image/png"):
+            return self.mime_type
+        return f"image/{self.image_format.lower()}"
+
+    @property
+    def file_bytes(self) -> Union[bytes, mmap.mmap]:
+        """
+        The file bytes, fetched on first access. Local PDF and TIFF files are opened
+        straight from their path, so their bytes are never loaded.
+        """
+        if self._file_bytes is None:
+            self._file_bytes = self._get_file_bytes()
+        return self._file_bytes
+
+    def __enter__(self) -> "FileConverter":
+        return self
 
-    def _get_file_bytes_and_mime_type(self) -> tuple[bytes, str]:
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the memory map held over a local file and delete the temporary copy of an
+        S3 document, if any. A closed converter can still be used, the file is then read again.
         """
-        Get the file bytes and MIME type of the file.
+        if isinstance(self._file_bytes, mmap.mmap):
+            self._file_bytes.close()
+        self._file_bytes = None
+        if self._tmp_path is not None:
+            self._tmp_cleanup()
+            self._tmp_path = None
+
+    def _get_file_bytes(self) -> Union[bytes, mmap.mmap]:
+        """
+        Get the file bytes. Local files, and S3 documents already downloaded to a temporary
+        file, are memory mapped rather than read, so only the parts actually used are paged in.
 
         Returns:
-            tuple[bytes, str]: A tuple containing the file bytes and MIME type.
+            Union[bytes, mmap.mmap]: The file bytes.
         """
-        if self.file_path.startswith("s3://"):
+        if self._is_s3 and self._tmp_path is None:
             if self.s3_client is None:
                 raise ValueError("S3 client is required for S3 file paths")
-            bucket_name, key = self._parse_s3_path(self.file_path)
-            response = self.s3_client.get_object(Bucket=bucket_name, Key=key)
-            file_bytes = response["Body"].read()
+            buffer = BytesIO()
+            self.s3_client.download_fileobj(
+                Bucket=self._bucket, Key=self._key, Fileobj=buffer, Config=S3_TRANSFER_CONFIG
+            )
+            file_bytes = buffer.getvalue()
         else:
-            with open(self.file_path, "rb") as f:
-                file_bytes = f.read()
+            with open(self._tmp_path if self._is_s3 else self.file_path, "rb") as f:
+                # empty files cannot be memory mapped
+                if os.fstat(f.fileno()).st_size == 0:
+                    file_bytes = b""
+                else:
+                    file_bytes = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return file_bytes
 
-        mime_type = self._get_mime_type(file_bytes)
-        return file_bytes, mime_type
+    def _get_source(self) -> Union[str, bytes]:
+        """
+        Get the document pages are rendered from. S3 documents are downloaded to a temporary
+        file rather than into memory, so PDFium and PIL read only the parts they need and
+        worker processes open the file instead of being sent a copy of its bytes.
 
-    def _get_mime_type(self, file_bytes: bytes) -> str:
+        Returns:
+            Union[str, bytes]: The path of the document, or its bytes if they are already loaded.
         """
-        Determine the MIME type of the file based on its contents.
+        if not self._is_s3:
+            return self.file_path
+        if self._file_bytes is not None:
+            return self._file_bytes
+        if self._tmp_path is None:
+            if self.s3_client is None:
+                raise ValueError("S3 client is required for S3 file paths")
+            fd, path = tempfile.mkstemp(suffix=os.path.splitext(self.file_path)[1])
+            self._tmp_cleanup = weakref.finalize(self, os.remove, path)
+            with os.fdopen(fd, "wb") as f:
+                self.s3_client.download_fileobj(
+                    Bucket=self._bucket, Key=self._key, Fileobj=f, Config=S3_TRANSFER_CONFIG
+                )
+            self._tmp_path = path
+        return self._tmp_path
 
-        Args:
-            file_bytes (bytes): The file bytes.
+    def _get_mime_type(self) -> str:
+        """
+        Determine the MIME type of the file based on its extension.
 
         Returns:
             str: The MIME type of the file.
@@ -69,10 +546,11 @@ class FileConverter:
         Raises:
             ValueError: If the file type is not supported.
         """
-        mime_type, _ = mimetypes.guess_type(self.file_path)
-        if mime_type is None:
+        try:
+            return _EXT_TO_MIME[os.path.splitext(self.file_path)[1].lower()]
+        except KeyError:
+            logger.error("Unsupported file type")
             raise ValueError("Unsupported file type")
-        return mime_type
 
     def _parse_s3_path(self, s3_path: str) -> tuple[str, str]:
         """
@@ -89,6 +567,65 @@ class FileConverter:
         key = parts[2]
         return bucket_name, key
 
+    def _select_pages(self, page_count: int) -> List[int]:
+        """
+        Resolve the requested page numbers against the document.
+
+        Args:
+            page_count (int): The number of pages in the document.
+
+        Returns:
+            List[int]: Zero based indices of the pages to convert, the first 20 pages if all
+            pages are requested.
+        """
+        if self.pages == [0]:
+            return list(range(min(20, page_count)))
+        return [p - 1 for p in self.pages if p <= page_count and p > 0]
+
+    def _page_limit(self) -> int:
+        """
+        Returns:
+            int: How many pages into the document the conversion needs to look, 20 if all
+            pages are requested, otherwise the highest requested page.
+        """
+        return 20 if self.pages == [0] else max(self.pages, default=0)
+
+    def _render_in_pool(
+        self, render: Any, page_nums: List[int]
+    ) -> Optional[Iterator[Tuple[int, str]]]:
+        """
+        Render pages in parallel worker processes, if configured to do so.
+
+        Args:
+            render (Callable): A module level render function such as `_render_pdf_page`.
+            page_nums (List[int]): Zero based page indices to render.
+
+        Returns:
+            Optional[Iterator[Tuple[int, str]]]: The rendered pages in `page_nums` order, or
+            None if the pages should be rendered serially.
+        """
+        # rendering is CPU bound, so more workers than cores only adds process start up cost
+        workers = min(
+            len(page_nums),
+            GlobalConfig.get_instance().max_render_workers,
+            os.cpu_count() or 1,
+        )
+        if workers < 2:
+            return None
+        source = self._get_source()
+        try:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_render_worker,
+                initargs=(source, self.max_pixel_dim, self.image_format),
+            )
+        except (OSError, NotImplementedError) as e:
+            # Environments such as AWS Lambda lack the shared memory process pools need
+            logger.warning(f"Process pool unavailable, rendering pages serially: {str(e)}")
+            return None
+        # keep every worker busy while the consumer handles the page in hand
+        return _iter_in_order(executor, render, page_nums, 2 * workers)
+
     def convert_to_base64(self) -> List[Dict[str, Union[int, str]]]:
         """
         Convert the file to Base64 encoded string(s).
@@ -99,92 +636,106 @@ class FileConverter:
         Raises:
             RuntimeError: If an error occurs during the file conversion process.
         """
+        return list(self.iter_base64())
+
+    def iter_base64(self) -> Iterator[Dict[str, Union[int, str]]]:
+        """
+        Convert the file to Base64 encoded string(s), yielding one page at a time. When pages
+        are rendered serially each page is only encoded once the previous one is consumed,
+        so callers that handle pages as they arrive hold a single page in memory. Parallel
+        rendering runs at most two pages per worker ahead of the caller.
+
+        Yields:
+            Dict[str, Union[int, str]]: A dictionary containing the page number and Base64
+            encoded string.
+
+        Raises:
+            RuntimeError: If an error occurs during the file conversion process.
+        """
+        handler = self._BASE64_HANDLERS.get(self.mime_type)
         try:
-            if self.mime_type == "image/jpeg" or self.mime_type == "image/png":
-                if self.file_path.startswith("s3://"):
-                    image_bytes = self.file_bytes
-                else:
-                    with open(self.file_path, "rb") as f:
-                        image_bytes = f.read()
-                validator = ImageValidator(image_bytes)
-                validator.validate_image()
-                base64_string = base64.b64encode(image_bytes).decode("utf-8")
-                return [{"page": 1, "base64string": base64_string}]
-
-            elif self.mime_type == "application/pdf":
-                with pdfplumber.open(
-                    BytesIO(self.file_bytes)
-                    if self.file_path.startswith("s3://")
-                    else self.file_path
-                ) as pdf:
-                    base64_strings = []
-                    if self.pages == [0]:
-                        page_nums = range(min(20, len(pdf.pages)))
-                    else:
-                        page_nums = [p - 1 for p in self.pages if p <= len(pdf.pages) and p > 0]
-
-                    for page_num in page_nums:
-                        page = pdf.pages[page_num]
-                        img = page.to_image(resolution=150).original
-                        img_bytes = BytesIO()
-                        img.save(img_bytes, format="PNG")
-                        base64_string = base64.b64encode(img_bytes.getvalue()).decode("utf-8")
-                        base64_strings.append({"page": page_num + 1, "base64string": base64_string})
-                return base64_strings
-
-            elif self.mime_type == "image/tiff":
-                with Image.open(
-                    BytesIO(self.file_bytes)
-                    if self.file_path.startswith("s3://")
-                    else self.file_path
-                ) as img:
-                    base64_strings = []
-                    if self.pages == [0]:
-                        frame_nums = range(min(20, img.n_frames))
-                    else:
-                        frame_nums = [p - 1 for p in self.pages if p <= img.n_frames and p > 0]
-                    for i in frame_nums:
-                        img.seek(i)
-                        img_byte_arr = BytesIO()
-                        img.save(img_byte_arr, format="PNG")
-                        base64_string = base64.b64encode(img_byte_arr.getvalue()).decode("utf-8")
-                        base64_strings.append({"page": i + 1, "base64string": base64_string})
-                return base64_strings
-            elif self.mime_type in [
-                "application/msword",
-                "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            ]:
-                if not DOCX_AVAILABLE:
-                    raise ImportError(
-                        "The 'python-docx' library is not installed. Please install it to process .docx files."
-                    )
-                document = Document(
-                    BytesIO(self.file_bytes)
-                    if self.file_path.startswith("s3://")
-                    else self.file_path
-                )
-                base64_strings = []
-                page_count = len(document.paragraphs)  # Assuming paragraphs as a proxy for pages
-                if self.pages == [0]:
-                    page_nums = range(min(20, page_count))
-                else:
-                    page_nums = [p - 1 for p in self.pages if p <= page_count and p > 0]
-
-                for page_num in page_nums:
-                    paragraph = document.paragraphs[page_num].text
-                    img = Image.new(
-                        "RGB", (800, 600), color=(255, 255, 255)
-                    )  # Placeholder image for paragraph
-                    d = ImageDraw.Draw(img)
-                    d.text((10, 10), paragraph, fill=(0, 0, 0))
-                    img_bytes = BytesIO()
-                    img.save(img_bytes, format="PNG")
-                    base64_string = base64.b64encode(img_bytes.getvalue()).decode("utf-8")
-                    base64_strings.append({"page": page_num + 1, "base64string": base64_string})
-                return base64_strings
-            else:
+            if handler is None:
                 logger.error("Unsupported file type")
                 raise ValueError("Unsupported file type")
+            yield from handler(self)
         except Exception as e:
             logger.error(f"Error converting file to Base64: {str(e)}")
             raise RuntimeError(f"Error converting file to Base64: {str(e)}")
+
+    def _iter_image_base64(self) -> Iterator[Dict[str, Union[int, str]]]:
+        image_bytes = self.file_bytes
+        validator = ImageValidator(image_bytes)
+        validator.validate_image()
+        yield {"page": 1, "base64string": _b64encode_string(image_bytes)}
+
+    def _iter_pdf_base64(self) -> Iterator[Dict[str, Union[int, str]]]:
+        pdf = pdfium.PdfDocument(self._get_source())
+        try:
+            page_nums = self._select_pages(len(pdf))
+
+            rendered = self._render_in_pool(_render_pdf_page, page_nums)
+            if rendered is None:
+                rendered = (
+                    (n, _render_pdf_page_image(pdf, n, self.max_pixel_dim, self.image_format))
+                    for n in page_nums
+                )
+            for page_num, base64_string in rendered:
+                yield {"page": page_num + 1, "base64string": base64_string}
+        finally:
+            pdf.close()
+
+    def _iter_tiff_base64(self) -> Iterator[Dict[str, Union[int, str]]]:
+        source = self._get_source()
+        with Image.open(_open_source(source)) as img:
+            frame_nums = self._select_pages(_tiff_frame_count(img, self._page_limit()))
+            threads = min(
+                len(frame_nums),
+                GlobalConfig.get_instance().max_render_workers,
+                os.cpu_count() or 1,
+            )
+            if threads > 1:
+                # Pillow releases the GIL while decoding and encoding, so frames encoded
+                # on threads run in parallel without the cost of a process pool
+                encode = partial(_encode_tiff_frame, source, self.image_format)
+                executor = ThreadPoolExecutor(max_workers=threads)
+                for i, base64_string in _iter_in_order(executor, encode, frame_nums, 2 * threads):
+                    yield {"page": i + 1, "base64string": base64_string}
+            else:
+                for i in frame_nums:
+                    img.seek(i)
+                    yield {"page": i + 1, "base64string": _image_to_base64(img, self.image_format)}
+
+    def _iter_docx_base64(self) -> Iterator[Dict[str, Union[int, str]]]:
+        if not DOCX_AVAILABLE:
+            raise ImportError(
+                "The 'python-docx' library is not installed. Please install it to process .docx files."
+            )
+        from docx import Document
+
+        document = Document(_open_source(self._get_source()))
+        font = ImageFont.load_default()
+        pages = _docx_pages(document, font, self._page_limit())
+        page_nums = self._select_pages(len(pages))
+
+        # Placeholder image for the page text, cleared and redrawn for every page
+        width, height = _DOCX_PAGE_SIZE
+        line_height = _docx_line_height(font)
+        img = Image.new("RGB", _DOCX_PAGE_SIZE, color=(255, 255, 255))
+        d = ImageDraw.Draw(img)
+        for page_num in page_nums:
+            d.rectangle((0, 0, width, height), fill=(255, 255, 255))
+            for i, line in enumerate(pages[page_num]):
+                y = _DOCX_MARGIN + i * line_height
+                d.text((_DOCX_MARGIN, y), line, font=font, fill=(0, 0, 0))
+            base64_string = _image_to_base64(img, self.image_format)
+            yield {"page": page_num + 1, "base64string": base64_string}
+
+    # Page generator for each supported MIME type
+    _BASE64_HANDLERS = {
+        "image/jpeg": _iter_image_base64,
+        "image/png": _iter_image_base64,
+        "application/pdf": _iter_pdf_base64,
+        "image/tiff": _iter_tiff_base64,
+        "application/msword": _iter_docx_base64,
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document": _iter_docx_base64,
+    }
@@ -1,14 +1,17 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-import io
 import logging
 from typing import Tuple
 
-from PIL import Image
-
 logger = logging.getLogger(__name__)
 
+# Leading bytes that identify each supported image format
+_MAGIC_BYTES = (
+    (b"\xff\xd8\xff", "jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+)
+
 
 class ImageValidator:
     def __init__(self, file_bytes: bytes):
@@ -16,14 +19,19 @@ class ImageValidator:
 
     def _get_image_size_and_format(self) -> Tuple[int, str]:
         """
-        Get the size (in bytes) and format of the image file.
+        Get the size (in bytes) and format of the image file. The format is read from the
+        file signature, so no image decoder is involved.
 
         Returns:
-            Tuple[int, str]: A tuple containing the file size and format.
+            Tuple[int, str]: A tuple containing the file size and format, "unknown" if the
+            signature is not one of the supported formats.
         """
-        image = Image.open(io.BytesIO(self.file_bytes))
         file_size = len(self.file_bytes)
-        file_format = image.format.lower()
+        file_format = "unknown"
+        for magic, image_format in _MAGIC_BYTES:
+            if self.file_bytes[: len(magic)] == magic:
+                file_format = image_format
+                break
         return file_size, file_format
 
     def validate_image(self) -> bool:
@@ -38,12 +46,12 @@ class ImageValidator:
         """
         file_size, file_format = self._get_image_size_and_format()
 
-        if file_format not in ["jpeg", "png"]:
-            logger.error(f"Unsupported file format: {file_format}")
-            raise ValueError(f"Unsupported file format: {file_format}")
-
         if file_size > 5 * 1024 * 1024:  # 5 MB
             logger.error("File size exceeds the maximum allowed limit of 5 MB")
             raise ValueError("File size exceeds the maximum allowed limit of 5 MB")
 
+        if file_format not in ["jpeg", "png"]:
+            logger.error(f"Unsupported file format: {file_format}")
+            raise ValueError(f"Unsupported file format: {file_format}")
+
         return True
@@ -1,7 +1,7 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from .entities import Entities
+from .entities import ENTITIES, Entities
 from .schema_factory import SchemaFactory
 
-__all__ = ["SchemaFactory", "Entities"]
+__all__ = ["SchemaFactory", "Entities", "ENTITIES"]
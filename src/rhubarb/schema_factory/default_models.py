@@ -1,11 +1,47 @@
-from typing import List
+import copy
+from typing import Any, List, Tuple, ClassVar, Optional
+from functools import lru_cache
 
 from pydantic import Field, BaseModel, GetJsonSchemaHandler
 from pydantic_core import core_schema as cs
 
 
+@lru_cache(maxsize=None)
+def _cached_json_schema(model: type, args: Tuple[Any, ...], kwargs: Tuple[Any, ...]) -> dict:
+    return super(_ArraySchemaMixin, model).model_json_schema(*args, **dict(kwargs))
+
+
+class _ArraySchemaMixin:
+    """Publishes a model's JSON schema as an array of per-page items."""
+
+    _array_description: ClassVar[Optional[str]] = "A document with one or more pages"
+
+    @classmethod
+    def _post_process_item_schema(cls, schema: dict) -> None:
+        """Hook for models that need to adjust the item schema in place."""
+
+    @classmethod
+    def model_json_schema(cls, *args, **kwargs) -> dict:
+        """
+        The model's JSON schema, generated once per set of arguments. A copy is returned
+        so callers are free to modify it.
+        """
+        return copy.deepcopy(_cached_json_schema(cls, args, tuple(sorted(kwargs.items()))))
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, core_schema: cs.CoreSchema, handler: GetJsonSchemaHandler
+    ):
+        schema = handler.resolve_ref_schema(handler(core_schema))
+        cls._post_process_item_schema(schema)
+        schema.pop("title", None)
+        if cls._array_description is None:
+            return {"type": "array", "items": schema}
+        return {"type": "array", "description": cls._array_description, "items": schema}
+
+
 # Default model
-class DefaultModel(BaseModel):
+class DefaultModel(_ArraySchemaMixin, BaseModel):
     page: int = Field(..., title="page", description="The page number of the document")
     detected_languages: List[str] = Field(
         ...,
@@ -14,19 +50,6 @@ class DefaultModel(BaseModel):
     )
     content: str = Field(..., title="content", description="Your response")
 
-    @classmethod
-    def __get_pydantic_json_schema__(
-        cls, core_schema: cs.CoreSchema, handler: GetJsonSchemaHandler
-    ):
-        schema = handler(core_schema)
-        schema = handler.resolve_ref_schema(schema)
-        del schema["title"]
-        return {
-            "type": "array",
-            "description": "A document with one or more pages",
-            "items": schema,
-        }
-
 
 # Chat model
 class ChatModel(BaseModel):
@@ -44,7 +67,7 @@ class ChatModel(BaseModel):
 
 
 # Figure model
-class FigureModel(BaseModel):
+class FigureModel(_ArraySchemaMixin, BaseModel):
     page: int = Field(..., title="page", description="The page number of the document")
     figure_analysis: str = Field(..., title="figure_analysis", description="Your response")
     figure_description: str = Field(
@@ -56,75 +79,39 @@ class FigureModel(BaseModel):
     )
 
     @classmethod
-    def __get_pydantic_json_schema__(
-        cls, core_schema: cs.CoreSchema, handler: GetJsonSchemaHandler
-    ):
-        schema = handler(core_schema)
-        schema = handler.resolve_ref_schema(schema)
+    def _post_process_item_schema(cls, schema: dict) -> None:
         schema["required"] = ["page", "figure_analysis"]
-        del schema["title"]
-        return {
-            "type": "array",
-            "description": "A document with one or more pages",
-            "items": schema,
-        }
 
 
 # Document classification model
-class ClassificationModel(BaseModel):
+class ClassificationModel(_ArraySchemaMixin, BaseModel):
     page: int = Field(..., title="page", description="The page number of the document")
     class_: str = Field(
         ..., title="class", description="The class this page belongs to.", alias="class"
     )
 
-    @classmethod
-    def __get_pydantic_json_schema__(
-        cls, core_schema: cs.CoreSchema, handler: GetJsonSchemaHandler
-    ):
-        schema = handler(core_schema)
-        schema = handler.resolve_ref_schema(schema)
-        del schema["title"]
-        return {
-            "type": "array",
-            "description": "A document with one or more pages",
-            "items": schema,
-        }
-
 
 # Multi-class Document classification model
-class MultiClassModel(BaseModel):
+class MultiClassModel(_ArraySchemaMixin, BaseModel):
     page: int = Field(..., title="page", description="The page number of the document")
     class_: List[str] = Field(
         ..., title="class", description="The classes the page may belong to.", alias="class"
     )
 
-    @classmethod
-    def __get_pydantic_json_schema__(
-        cls, core_schema: cs.CoreSchema, handler: GetJsonSchemaHandler
-    ):
-        schema = handler(core_schema)
-        schema = handler.resolve_ref_schema(schema)
-        del schema["title"]
-        return {
-            "type": "array",
-            "description": "A document with one or more pages, where each page belongs to one or more class",
-            "items": schema,
-        }
+    _array_description: ClassVar[str] = (
+        "A document with one or more pages, where each page belongs to one or more class"
+    )
 
 
 # Name Entity Recognition Model
-class NERModel(BaseModel):
+class NERModel(_ArraySchemaMixin, BaseModel):
     page: int = Field(..., title="page", description="The page number of the document")
     entities: List[dict] = Field(
         ..., title="entities", description="Common named entities found in this page"
     )
 
+    _array_description: ClassVar[Optional[str]] = None
+
     @classmethod
-    def __get_pydantic_json_schema__(
-        cls, core_schema: cs.CoreSchema, handler: GetJsonSchemaHandler
-    ):
-        json_schema = handler(core_schema)
-        json_schema = handler.resolve_ref_schema(json_schema)
-        json_schema["properties"]["entities"]["items"]["oneOf"] = []
-        del json_schema["title"]
-        return {"type": "array", "items": json_schema}
+    def _post_process_item_schema(cls, schema: dict) -> None:
+        schema["properties"]["entities"]["items"]["oneOf"] = []
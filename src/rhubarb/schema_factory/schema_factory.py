@@ -2,8 +2,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import os
+import copy
 import json
 import logging
+from functools import lru_cache
 
 from .default_models import (
     NERModel,
@@ -17,39 +19,38 @@ from .default_models import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _load_json_file(filepath: str) -> dict:
+    with open(filepath, "r") as json_file:
+        return json.load(json_file)
+
+
 class SchemaFactory:
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+    _SCHEMA_BUILDERS = {
+        "chat_schema": ChatModel.model_json_schema,
+        "default_schema": DefaultModel.model_json_schema,
+        "classification_schema": ClassificationModel.model_json_schema,
+        "multiclass_schema": MultiClassModel.model_json_schema,
+        "ner_schema": NERModel.model_json_schema,
+        "figure_schema": FigureModel.model_json_schema,
+    }
+
     def __getattr__(self, name):
-        if name.lower() == "chat_schema":
-            return ChatModel.model_json_schema()
-        if name.lower() == "default_schema":
-            return DefaultModel.model_json_schema()
-        if name.lower() == "classification_schema":
-            return ClassificationModel.model_json_schema()
-        if name.lower() == "multiclass_schema":
-            return MultiClassModel.model_json_schema()
-        if name.lower() == "ner_schema":
-            return NERModel.model_json_schema()
-        if name.lower() == "figure_schema":
-            return FigureModel.model_json_schema()
-        if name.lower() == "sample_schema":
-            json_filename = f"{name.lower()}.json"
+        key = name.lower()
+        builder = self._SCHEMA_BUILDERS.get(key)
+        if builder is not None:
+            # the models memoize their schemas and hand out a fresh copy on every call
+            return builder()
+        if key == "sample_schema":
+            json_filename = f"{key}.json"
             filepath = os.path.join(self.BASE_DIR, "fewshot", json_filename)
-            if not os.path.exists(filepath):
+            try:
+                schema = _load_json_file(filepath)
+            except FileNotFoundError:
                 logger.error(f"No such JSON file: {json_filename} in {filepath}")
                 raise AttributeError(f"No such JSON file: {json_filename} in {filepath}")
-
-            with open(filepath, "r") as json_file:
-                return json.load(json_file)
-
-    # def __getattr__(self, name):
-    #     json_filename = f"{name.lower()}.json"
-    #     filepath = os.path.join(self.BASE_DIR, "single_doc_schemas", json_filename)
-
-    #     if not os.path.exists(filepath):
-    #         logger.error(f"No such JSON file: {json_filename} in {filepath}")
-    #         raise AttributeError(f"No such JSON file: {json_filename} in {filepath}")
-
-    #     with open(filepath, "r") as json_file:
-    #         return json.load(json_file)
+            # the parsed file is shared, so callers get a copy they are free to modify
+            return copy.deepcopy(schema)
+        raise AttributeError(f"'SchemaFactory' object has no attribute '{name}'")
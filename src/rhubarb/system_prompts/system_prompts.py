@@ -2,25 +2,97 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import json
-from typing import List
-from datetime import datetime
+import time
+from typing import Any, Dict, List, Tuple, Callable
+from datetime import datetime, timedelta
+from functools import wraps, lru_cache
 
 from rhubarb.schema_factory import SchemaFactory
 
+# Rendered prompts keyed by (prompt name, date, streaming), shared by every SystemPrompts
+_PROMPT_CACHE: Dict[Tuple[Any, ...], str] = {}
+_PROMPT_CACHE_SIZE = 64
+
+
+# Today's date as shown in the prompts, with the timestamp of the midnight it expires at
+_DATE_CACHE: List[Any] = [0.0, ""]
+
+
+def _today() -> str:
+    """
+    Returns:
+        str: Today's date formatted for the prompts, formatted once per day.
+    """
+    if time.time() >= _DATE_CACHE[0]:
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        _DATE_CACHE[:] = [midnight.timestamp(), now.strftime("%b-%m-%Y")]
+    return _DATE_CACHE[1]
+
+
+@lru_cache(maxsize=None)
+def _schema_json(name: str) -> str:
+    """
+    Serializes one of the static `SchemaFactory` schemas, once per process.
+
+    Args:
+        name (str): The schema name, e.g. "default_schema".
+
+    Returns:
+        str: The schema as a JSON string.
+    """
+    return json.dumps(getattr(SchemaFactory(), name))
+
+
+@lru_cache(maxsize=64)
+def _ner_schema_json(entities_json: str) -> str:
+    """
+    Serializes the NER schema restricted to the given entities. Keyed by the entities'
+    JSON, so the same selection reused across calls is only built once.
+
+    Args:
+        entities_json (str): The selected entities as a JSON array.
+
+    Returns:
+        str: The NER schema as a JSON string.
+    """
+    schema = SchemaFactory().ner_schema
+    schema["items"]["properties"]["entities"]["items"]["oneOf"] = json.loads(entities_json)
+    return json.dumps(schema)
+
+
+def _cached_prompt(render: Callable[["SystemPrompts"], str]) -> Callable[["SystemPrompts"], str]:
+    """
+    Memoizes a prompt that only depends on the date and the streaming flag, so it is
+    rendered once and then reused by every `SystemPrompts` instance.
+    """
+
+    @wraps(render)
+    def wrapper(self: "SystemPrompts") -> str:
+        key = (render.__name__, self.dt, self.streaming)
+        prompt = _PROMPT_CACHE.get(key)
+        if prompt is None:
+            if len(_PROMPT_CACHE) >= _PROMPT_CACHE_SIZE:
+                _PROMPT_CACHE.clear()
+            prompt = _PROMPT_CACHE[key] = render(self)
+        return prompt
+
+    return wrapper
+
 
 class SystemPrompts:
     def __init__(self, entities: List[dict] = None, streaming: bool = False):
         self.entities = entities
         self.streaming = streaming
-        self.dt = datetime.now().strftime("%b-%m-%Y")
+        self.dt = _today()
 
     @property
+    @_cached_prompt
     def DefaultSysPrompt(self):
         """
         Default LLM system prompt, responds with JSON (non-streaming)
         """
-        sf = SchemaFactory()
-        schema = json.dumps(sf.default_schema)
+        schema = _schema_json("default_schema")
         return f"""You are an expert document analysis system and today's date is {self.dt}. Given the pages of a document, 
         answer truthfully and accurately. When answering strictly follow the instructions.
         
@@ -41,6 +113,7 @@ class SystemPrompts:
         </json_schema>"""
 
     @property
+    @_cached_prompt
     def SchemaSysPrompt(self):
         """
         Schema based LLM system prompt, always responds with a JSON (non-streaming)
@@ -57,14 +130,14 @@ class SystemPrompts:
         """
 
     @property
+    @_cached_prompt
     def ChatSysPrompt(self):
         """
         Default LLM chat system prompt, responds with text (can be streaming or non-streaming)
         """
         schema = ""
         if not self.streaming:
-            sf = SchemaFactory()
-            schema = json.dumps(sf.chat_schema)
+            schema = _schema_json("chat_schema")
         return f"""You are an expert document analysis system and today's date is {self.dt}.Given the pages of a document, 
         answer truthfully and accurately. When answering strictly follow the instructions.
 
@@ -85,6 +158,7 @@ class SystemPrompts:
         </json_schema>"""
 
     @property
+    @_cached_prompt
     def SummarySysPrompt(self):
         """
         Default LLM summary system prompt, responds with text (can be streaming or non-streaming)
@@ -95,12 +169,12 @@ class SystemPrompts:
         - Do not add any preamble or conclusion."""
 
     @property
+    @_cached_prompt
     def FigureSysPrompt(self):
         """
         Default LLM figure system prompt, responds with JSON (non-streaming)
         """
-        sf = SchemaFactory()
-        schema = json.dumps(sf.figure_schema)
+        schema = _schema_json("figure_schema")
         return f"""You are an expert document analysis system and today's date is {self.dt}. Given the pages of a document, 
         answer truthfully and accurately. When answering strictly follow the instructions.
 
@@ -121,11 +195,9 @@ class SystemPrompts:
         """
         Default LLM figure system prompt, responds with JSON (non-streaming)
         """
-        sf = SchemaFactory().ner_schema
         if not self.entities:
             raise ValueError("Entities list required")
-        sf["items"]["properties"]["entities"]["items"]["oneOf"] = self.entities
-        schema = json.dumps(sf)
+        schema = _ner_schema_json(json.dumps(self.entities))
         return f"""You are an expert document analysis system which specializes named entity recognition (NER). Today's date is {self.dt}. Given the pages of a document, 
         answer truthfully and accurately. When answering strictly follow the instructions.
 
@@ -143,12 +215,12 @@ class SystemPrompts:
         </NER_Schema>"""
 
     @property
+    @_cached_prompt
     def SchemaGenSysPrompt(self):
         """
         Default LLM JSON Schema system prompt, responds with a JSON Schema (non-streaming)
         """
-        sf = SchemaFactory()
-        schema = json.dumps(sf.sample_schema)
+        schema = _schema_json("sample_schema")
         return f"""You are an expert document analysis system and today's date is {self.dt}. Given the pages of a document, 
         answer truthfully and accurately. When answering strictly follow the instructions.
 
@@ -170,6 +242,7 @@ class SystemPrompts:
         </sample_schema>"""
 
     @property
+    @_cached_prompt
     def SchemaGenSysPromptWithRephrase(self):
         """
         Default LLM JSON Schema system prompt with user question rephrase, responds with a JSON Schema (non-streaming)
@@ -208,12 +281,12 @@ class SystemPrompts:
         </sample_schema>"""
 
     @property
+    @_cached_prompt
     def ClassificationSysPrompt(self):
         """
         Default LLM system prompt, responds with JSON (non-streaming)
         """
-        sf = SchemaFactory()
-        schema = json.dumps(sf.classification_schema)
+        schema = _schema_json("classification_schema")
         return f"""You are an expert document analysis system and today's date is {self.dt}.  Given the pages of a document, 
         answer truthfully and accurately. When answering strictly follow the instructions.
         
@@ -230,12 +303,12 @@ class SystemPrompts:
         </json_schema>"""
 
     @property
+    @_cached_prompt
     def MultiClassificationSysPrompt(self):
         """
         Default LLM system prompt, responds with JSON (non-streaming)
         """
-        sf = SchemaFactory()
-        schema = json.dumps(sf.multiclass_schema)
+        schema = _schema_json("multiclass_schema")
         return f"""You are an expert document analysis system and today's date is {self.dt}.  Given the pages of a document, 
         answer truthfully and accurately. When answering strictly follow the instructions.
 
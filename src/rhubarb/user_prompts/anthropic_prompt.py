@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import json
-from typing import Any, List, Optional
+from typing import Any, List, Literal, Optional
 
 import jsonschema
 
@@ -22,6 +22,8 @@ class AnthropicMessages:
         pages: List[int],
         output_schema: Optional[dict] = None,
         message_history: Optional[List[dict]] = None,
+        image_format: Literal["PNG", "JPEG"] = "PNG",
+        page_cache: Optional[dict] = None,
     ) -> None:
         self.file_path = file_path
         self.s3_client = s3_client
@@ -32,12 +34,31 @@ class AnthropicMessages:
         self.temperature = temperature
         self.pages = pages
         self.message_history = message_history
+        self.image_format = image_format
+        self.page_cache = page_cache
+        self.media_type = "image/png"
 
     def _get_base64_from_doc(self) -> List[dict]:
-        fc = FileConverter(
-            file_path=self.file_path, s3_client=self.s3_client, pages=self.pages
-        )
-        base64_pages = fc.convert_to_base64()
+        # pages converted by an earlier message about the same document are reused
+        cache_key = (self.file_path, tuple(self.pages), self.image_format)
+        # a single lookup, another thread may clear the cache between a check and a read
+        cached = self.page_cache.get(cache_key) if self.page_cache is not None else None
+        if cached is not None:
+            base64_pages, self.media_type = cached
+            return base64_pages
+
+        with FileConverter(
+            file_path=self.file_path,
+            s3_client=self.s3_client,
+            pages=self.pages,
+            image_format=self.image_format,
+        ) as fc:
+            base64_pages = fc.convert_to_base64()
+            self.media_type = fc.media_type
+        if self.page_cache is not None:
+            # only the latest document is kept
+            self.page_cache.clear()
+            self.page_cache[cache_key] = (base64_pages, self.media_type)
         return base64_pages
 
     def _validate_if_schema(self) -> str:
@@ -78,7 +99,7 @@ class AnthropicMessages:
                     "type": "image",
                     "source": {
                         "type": "base64",
-                        "media_type": "image/png",
+                        "media_type": self.media_type,
                         "data": page["base64string"],
                     },
                 },
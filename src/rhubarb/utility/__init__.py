@@ -1,6 +1,6 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from .s3utility import S3Utility
+from .s3utility import S3_TRANSFER_CONFIG, S3Utility
 
-__all__=[ "S3Utility" ]
\ No newline at end of file
+__all__=[ "S3Utility", "S3_TRANSFER_CONFIG" ]
\ No newline at end of file
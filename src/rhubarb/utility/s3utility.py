@@ -2,22 +2,36 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+from io import BytesIO
 from typing import Any, Tuple, Optional
 
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+# Objects above the threshold are fetched as concurrent ranged GETs
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
+
 class S3Utility:
     def __init__(self, s3_client: Any) -> None:
         self.s3_client = s3_client
 
     def read_file(self, s3_path: str) -> Optional[bytes]:
-        """Reads a file from S3 and returns its bytes."""
+        """Reads a file from S3 and returns its bytes, large files are downloaded in parallel parts."""
         bucket_name, object_key = self._parse_s3_path(s3_path)
         try:
-            response = self.s3_client.get_object(Bucket=bucket_name, Key=object_key)
-            return response['Body'].read()
+            buffer = BytesIO()
+            self.s3_client.download_fileobj(
+                Bucket=bucket_name, Key=object_key, Fileobj=buffer, Config=S3_TRANSFER_CONFIG
+            )
+            return buffer.getvalue()
         except ClientError as e:
             logger.error(f"Failed to read file {s3_path}: {e}")
             raise e
@@ -1,8 +1,15 @@
 import os
+import base64
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
+from concurrent.futures import ThreadPoolExecutor
 
+from PIL import Image
+
+from rhubarb.config import GlobalConfig
 from rhubarb.file_converter import FileConverter
+from rhubarb.file_converter.file_converter import DOCX_AVAILABLE
 
 
 class TestFileConverter(unittest.TestCase):
@@ -15,17 +22,25 @@ class TestFileConverter(unittest.TestCase):
         )
         self.tiff_file_path = os.path.join(os.path.dirname(__file__), "test_docs", "memorandum.tif")
 
+    def _make_multiframe_tiff(self) -> str:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        frames = [Image.new("RGB", (64, 64), color=(i * 80, 0, 0)) for i in range(3)]
+        tiff_path = os.path.join(tmp_dir.name, "frames.tif")
+        frames[0].save(tiff_path, format="TIFF", save_all=True, append_images=frames[1:])
+        return tiff_path
+
     @patch("boto3.client")
     def test_s3_file_conversion(self, mock_boto3_client):
         mock_boto3_client = MagicMock()
         with open(self.png_file_path, "rb") as f:
             file_bytes = f.read()
 
-        # Mock S3 response to return file bytes
-        mock_streaming_body = MagicMock()
-        mock_streaming_body.read.return_value = file_bytes
-        mock_s3_response = {"Body": mock_streaming_body}
-        mock_boto3_client.get_object.return_value = mock_s3_response
+        # Mock S3 download to write the file bytes
+        def download_fileobj(Bucket, Key, Fileobj, **kwargs):
+            Fileobj.write(file_bytes)
+
+        mock_boto3_client.download_fileobj.side_effect = download_fileobj
 
         # Mock S3 path
         s3_png_file_path = "s3://bucket/test.png"
@@ -35,6 +50,84 @@ class TestFileConverter(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertIn("base64string", result[0])
 
+    @patch("boto3.client")
+    def test_s3_pdf_file_conversion(self, mock_boto3_client):
+        mock_boto3_client = MagicMock()
+        with open(self.multi_pdf_file_path, "rb") as f:
+            file_bytes = f.read()
+
+        # Mock S3 download to write the file bytes
+        def download_fileobj(Bucket, Key, Fileobj, **kwargs):
+            Fileobj.write(file_bytes)
+
+        mock_boto3_client.download_fileobj.side_effect = download_fileobj
+
+        with FileConverter(
+            "s3://bucket/test.pdf", pages=[0], s3_client=mock_boto3_client
+        ) as converter:
+            result = converter.convert_to_base64()
+            tmp_path = converter._tmp_path
+            self.assertTrue(os.path.exists(tmp_path))
+        self.assertEqual(len(result), 3)
+        # The temporary copy of the document is removed once the converter is closed
+        self.assertFalse(os.path.exists(tmp_path))
+        mock_boto3_client.download_fileobj.assert_called_once()
+        # A closed converter downloads the document again when reused
+        self.assertEqual(converter.convert_to_base64(), result)
+        self.assertEqual(mock_boto3_client.download_fileobj.call_count, 2)
+        converter.close()
+
+    @patch("boto3.client")
+    def test_s3_file_fetched_lazily(self, mock_boto3_client):
+        mock_boto3_client = MagicMock()
+
+        # Creating the converter and reading its media type must not download the file
+        converter = FileConverter("s3://bucket/test.pdf", pages=[0], s3_client=mock_boto3_client)
+        self.assertEqual(converter.mime_type, "application/pdf")
+        self.assertEqual(converter.media_type, "image/png")
+        mock_boto3_client.download_fileobj.assert_not_called()
+
+        # Unsupported types are rejected without any S3 call
+        with self.assertRaises(ValueError):
+            FileConverter("s3://bucket/test.xlsx", pages=[0], s3_client=mock_boto3_client)
+        mock_boto3_client.download_fileobj.assert_not_called()
+
+    @patch("boto3.client")
+    def test_s3_prefix_file_conversion(self, mock_boto3_client):
+        mock_boto3_client = MagicMock()
+        with open(self.png_file_path, "rb") as f:
+            file_bytes = f.read()
+
+        # Mock S3 listing with two supported files and one unsupported file
+        mock_paginator = MagicMock()
+        mock_paginator.paginate.return_value = [
+            {"Contents": [{"Key": "docs/a.png"}, {"Key": "docs/notes.unknown"}]},
+            {"Contents": [{"Key": "docs/b.png"}]},
+        ]
+        mock_boto3_client.get_paginator.return_value = mock_paginator
+
+        def download_fileobj(Bucket, Key, Fileobj, **kwargs):
+            Fileobj.write(file_bytes)
+
+        mock_boto3_client.download_fileobj.side_effect = download_fileobj
+
+        converters = FileConverter.from_s3_prefix(
+            bucket="bucket", prefix="docs/", s3_client=mock_boto3_client
+        )
+        self.assertEqual(
+            [c.file_path for c in converters], ["s3://bucket/docs/a.png", "s3://bucket/docs/b.png"]
+        )
+        self.assertIsNot(converters[0].pages, converters[1].pages)
+        # documents are downloaded up front, so converting them makes no further S3 calls
+        self.assertEqual(mock_boto3_client.download_fileobj.call_count, 2)
+        for converter in converters:
+            with converter:
+                result = converter.convert_to_base64()
+            self.assertEqual(len(result), 1)
+            self.assertIn("base64string", result[0])
+        self.assertEqual(mock_boto3_client.download_fileobj.call_count, 2)
+        mock_boto3_client.get_object.assert_not_called()
+
     @patch("boto3.client")
     def test_local_png_file_conversion(self, mock_boto3_client):
         mock_boto3_client = MagicMock()
@@ -57,6 +150,22 @@ class TestFileConverter(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertIn("base64string", result[0])
 
+    @patch("boto3.client")
+    def test_s3_image_with_unsupported_signature(self, mock_boto3_client):
+        mock_boto3_client = MagicMock()
+        with open(self.tiff_file_path, "rb") as f:
+            file_bytes = f.read()
+
+        # Mock S3 download of a TIFF saved with a .png extension
+        def download_fileobj(Bucket, Key, Fileobj, **kwargs):
+            Fileobj.write(file_bytes)
+
+        mock_boto3_client.download_fileobj.side_effect = download_fileobj
+
+        converter = FileConverter("s3://bucket/test.png", pages=[0], s3_client=mock_boto3_client)
+        with self.assertRaises(RuntimeError):
+            converter.convert_to_base64()
+
     @patch("boto3.client")
     def test_local_pdf_file_conversion(self, mock_boto3_client):
         mock_boto3_client = MagicMock()
@@ -83,6 +192,57 @@ class TestFileConverter(unittest.TestCase):
             self.assertIn("page", page)
             self.assertIn("base64string", page)
 
+    @patch("boto3.client")
+    def test_local_multipdf_file_iteration(self, mock_boto3_client):
+        mock_boto3_client = MagicMock()
+        with FileConverter(
+            file_path=self.multi_pdf_file_path, pages=[0], s3_client=mock_boto3_client
+        ) as converter:
+            pages = converter.iter_base64()
+            self.assertEqual(next(pages)["page"], 1)
+            self.assertEqual([page["page"] for page in pages], [2, 3])
+
+    @patch("boto3.client")
+    def test_local_pdf_file_conversion_to_jpeg(self, mock_boto3_client):
+        mock_boto3_client = MagicMock()
+        converter = FileConverter(
+            file_path=self.multi_pdf_file_path,
+            pages=[2],
+            s3_client=mock_boto3_client,
+            image_format="JPEG",
+        )
+        result = converter.convert_to_base64()
+        self.assertEqual(converter.media_type, "image/jpeg")
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["page"], 2)
+        self.assertTrue(base64.b64decode(result[0]["base64string"]).startswith(b"\xff\xd8\xff"))
+
+    @patch("rhubarb.file_converter.file_converter.os.cpu_count", return_value=1)
+    @patch("rhubarb.file_converter.file_converter.ProcessPoolExecutor")
+    def test_render_workers_capped_at_cpu_count(self, mock_executor, mock_cpu_count):
+        GlobalConfig.update_config(max_render_workers=4)
+        self.addCleanup(GlobalConfig.update_config)
+        converter = FileConverter(file_path=self.multi_pdf_file_path, pages=[0], s3_client=None)
+        result = converter.convert_to_base64()
+        mock_executor.assert_not_called()
+        self.assertEqual([page["page"] for page in result], [1, 2, 3])
+
+    @patch("rhubarb.file_converter.file_converter.os.cpu_count", return_value=4)
+    def test_pdf_pages_streamed_from_process_pool(self, mock_cpu_count):
+        expected = FileConverter(
+            file_path=self.multi_pdf_file_path, pages=[0], s3_client=None
+        ).convert_to_base64()
+        GlobalConfig.update_config(max_render_workers=2)
+        self.addCleanup(GlobalConfig.update_config)
+        with FileConverter(
+            file_path=self.multi_pdf_file_path, pages=[0], s3_client=None
+        ) as converter:
+            pages = converter.iter_base64()
+            self.assertEqual(next(pages), expected[0])
+            # abandoning the iterator part way shuts the pool down cleanly
+            pages.close()
+            self.assertEqual(converter.convert_to_base64(), expected)
+
     @patch("boto3.client")
     def test_local_tiff_file_conversion(self, mock_boto3_client):
         mock_boto3_client = MagicMock()
@@ -96,6 +256,66 @@ class TestFileConverter(unittest.TestCase):
             self.assertIn("page", page)
             self.assertIn("base64string", page)
 
+    @patch("rhubarb.file_converter.file_converter.os.cpu_count", return_value=4)
+    @patch("rhubarb.file_converter.file_converter.ProcessPoolExecutor")
+    @patch("rhubarb.file_converter.file_converter.ThreadPoolExecutor", wraps=ThreadPoolExecutor)
+    def test_multiframe_tiff_threaded_conversion(
+        self, mock_threads, mock_processes, mock_cpu_count
+    ):
+        tiff_path = self._make_multiframe_tiff()
+        serial = FileConverter(file_path=tiff_path, pages=[0], s3_client=None)
+        expected = serial.convert_to_base64()
+        mock_threads.assert_not_called()
+
+        # frames are encoded on threads, never in a process pool
+        GlobalConfig.update_config(max_render_workers=2)
+        self.addCleanup(GlobalConfig.update_config)
+        threaded = FileConverter(file_path=tiff_path, pages=[0], s3_client=None)
+        result = threaded.convert_to_base64()
+        mock_threads.assert_called_once_with(max_workers=2)
+        mock_processes.assert_not_called()
+        self.assertEqual([page["page"] for page in result], [1, 2, 3])
+        self.assertEqual(result, expected)
+
+    def test_multiframe_tiff_pages_beyond_last_frame(self):
+        tiff_path = self._make_multiframe_tiff()
+        converter = FileConverter(file_path=tiff_path, pages=[2, 5], s3_client=None)
+        result = converter.convert_to_base64()
+        self.assertEqual([page["page"] for page in result], [2])
+
+    def test_multiframe_tiff_no_pages_requested(self):
+        tiff_path = self._make_multiframe_tiff()
+        converter = FileConverter(file_path=tiff_path, pages=[], s3_client=None)
+        result = converter.convert_to_base64()
+        self.assertEqual(result, [])
+
+    @unittest.skipUnless(DOCX_AVAILABLE, "python-docx is not installed")
+    def test_docx_pages_follow_page_breaks(self):
+        from docx import Document
+        from docx.enum.text import WD_BREAK
+
+        document = Document()
+        paragraph = document.add_paragraph("First page")
+        paragraph.add_run().add_break(WD_BREAK.PAGE)
+        document.add_paragraph("Second page")
+        for i in range(2000):
+            document.add_paragraph(f"Line {i}")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            docx_path = os.path.join(tmp_dir, "pages.docx")
+            document.save(docx_path)
+
+            converter = FileConverter(file_path=docx_path, pages=[0], s3_client=None)
+            result = converter.convert_to_base64()
+            self.assertEqual([page["page"] for page in result], list(range(1, 21)))
+
+            # A single paragraph per page would have made the first page blank after the break
+            first = FileConverter(file_path=docx_path, pages=[1], s3_client=None)
+            second = FileConverter(file_path=docx_path, pages=[2], s3_client=None)
+            self.assertNotEqual(
+                first.convert_to_base64()[0]["base64string"],
+                second.convert_to_base64()[0]["base64string"],
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
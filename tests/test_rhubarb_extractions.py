@@ -4,6 +4,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from rhubarb import DocAnalysis
+from rhubarb.file_converter import FileConverter
 
 
 class TestExtractions(unittest.TestCase):
@@ -57,3 +58,95 @@ class TestExtractions(unittest.TestCase):
         response = da.run(message="What is the employee's name?")
         self.assertEqual(response["output"], model_response)
         self.assertEqual(response["token_usage"], {"input_tokens": 5063, "output_tokens": 95})
+
+    def test_jpeg_pages(self):
+        model_response = [{"page": 3, "detected_languages": ["English"], "content": "Loki Flores"}]
+        api_response = {
+            "role": "assistant",
+            "content": [{"type": "text", "text": f"```json\n{json.dumps(model_response)}\n```"}],
+            "usage": {"input_tokens": 1688, "output_tokens": 40},
+        }
+        mock_response_streaming = MagicMock()
+        mock_response_streaming.read.return_value = json.dumps(api_response).encode("utf-8")
+        mock_response_streaming.__enter__.return_value = mock_response_streaming
+        mock_response_streaming.__exit__.return_value = None
+        self.mock_bedrock_client.invoke_model.return_value = {"body": mock_response_streaming}
+
+        da = DocAnalysis(
+            file_path=self.multi_pdf_file_path,
+            boto3_session=self.mock_session(),
+            pages=[3],
+            image_format="JPEG",
+        )
+        response = da.run(message="What is the beneficiary's name?")
+        self.assertEqual(response["output"], model_response)
+
+        body = json.loads(self.mock_bedrock_client.invoke_model.call_args.kwargs["body"])
+        image = body["messages"][0]["content"][1]
+        self.assertEqual(image["source"]["media_type"], "image/jpeg")
+
+    def test_pages_converted_once(self):
+        model_response = [{"page": 1, "detected_languages": ["English"], "content": "Cali Flores"}]
+        api_response = {
+            "role": "assistant",
+            "content": [{"type": "text", "text": f"```json\n{json.dumps(model_response)}\n```"}],
+            "usage": {"input_tokens": 5063, "output_tokens": 95},
+        }
+        mock_response_streaming = MagicMock()
+        mock_response_streaming.read.return_value = json.dumps(api_response).encode("utf-8")
+        mock_response_streaming.__enter__.return_value = mock_response_streaming
+        mock_response_streaming.__exit__.return_value = None
+        self.mock_bedrock_client.invoke_model.return_value = {"body": mock_response_streaming}
+
+        da = DocAnalysis(file_path=self.multi_pdf_file_path, boto3_session=self.mock_session())
+        with patch(
+            "rhubarb.user_prompts.anthropic_prompt.FileConverter", wraps=FileConverter
+        ) as mock_converter:
+            da.run(message="What is the employee's name?")
+            da.run(message="What is the employee's date of birth?")
+        mock_converter.assert_called_once()
+
+        first, second = self.mock_bedrock_client.invoke_model.call_args_list
+        first_pages = json.loads(first.kwargs["body"])["messages"][0]["content"][:-1]
+        second_pages = json.loads(second.kwargs["body"])["messages"][0]["content"][:-1]
+        self.assertEqual(first_pages, second_pages)
+
+    def test_s3_client_only_for_s3_documents(self):
+        DocAnalysis(file_path=self.multi_pdf_file_path, boto3_session=self.mock_session())
+        services = [c.args[0] for c in self.mock_session.return_value.client.call_args_list]
+        self.assertEqual(services, ["bedrock-runtime"])
+
+        DocAnalysis(file_path="s3://bucket/test.pdf", boto3_session=self.mock_session())
+        services = [c.args[0] for c in self.mock_session.return_value.client.call_args_list]
+        self.assertEqual(services, ["bedrock-runtime", "s3", "bedrock-runtime"])
+
+    def test_s3_instance_unaffected_by_local_instance(self):
+        model_response = [{"page": 1, "detected_languages": ["English"], "content": "Cali Flores"}]
+        api_response = {
+            "role": "assistant",
+            "content": [{"type": "text", "text": f"```json\n{json.dumps(model_response)}\n```"}],
+            "usage": {"input_tokens": 5063, "output_tokens": 95},
+        }
+        mock_response_streaming = MagicMock()
+        mock_response_streaming.read.return_value = json.dumps(api_response).encode("utf-8")
+        mock_response_streaming.__enter__.return_value = mock_response_streaming
+        mock_response_streaming.__exit__.return_value = None
+        self.mock_bedrock_client.invoke_model.return_value = {"body": mock_response_streaming}
+
+        with open(self.multi_pdf_file_path, "rb") as f:
+            file_bytes = f.read()
+
+        def download_fileobj(Bucket, Key, Fileobj, **kwargs):
+            Fileobj.write(file_bytes)
+
+        self.mock_s3_client.download_fileobj.side_effect = download_fileobj
+
+        s3_da = DocAnalysis(file_path="s3://bucket/test.pdf", boto3_session=self.mock_session())
+        local_da = DocAnalysis(
+            file_path=self.multi_pdf_file_path, boto3_session=self.mock_session()
+        )
+        self.assertIsNone(local_da._s3_client)
+
+        response = s3_da.run(message="What is the employee's name?")
+        self.assertEqual(response["output"], model_response)
+        self.mock_s3_client.download_fileobj.assert_called_once()
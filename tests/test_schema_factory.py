@@ -0,0 +1,51 @@
+import copy
+import unittest
+
+from rhubarb.schema_factory import SchemaFactory
+from rhubarb.schema_factory.default_models import NERModel, ChatModel, DefaultModel
+
+SCHEMA_NAMES = [
+    "chat_schema",
+    "default_schema",
+    "classification_schema",
+    "multiclass_schema",
+    "ner_schema",
+    "figure_schema",
+    "sample_schema",
+]
+
+
+class TestSchemaFactory(unittest.TestCase):
+    def test_schemas_match_models(self):
+        sf = SchemaFactory()
+        self.assertEqual(sf.default_schema, DefaultModel.model_json_schema())
+        self.assertEqual(sf.chat_schema, ChatModel.model_json_schema())
+        self.assertEqual(sf.ner_schema, NERModel.model_json_schema())
+        # names are case insensitive
+        self.assertEqual(sf.Default_Schema, sf.default_schema)
+
+    def test_mutating_schema_does_not_leak(self):
+        for name in SCHEMA_NAMES:
+            with self.subTest(name=name):
+                sf = SchemaFactory()
+                original = copy.deepcopy(getattr(sf, name))
+
+                schema = getattr(sf, name)
+                schema["mutated"] = True
+                next(v for v in schema.values() if isinstance(v, dict))["mutated"] = True
+
+                self.assertEqual(getattr(sf, name), original)
+                self.assertEqual(getattr(SchemaFactory(), name), original)
+
+    def test_model_json_schema_returns_copies(self):
+        schema = NERModel.model_json_schema()
+        schema["items"]["properties"]["entities"]["items"]["oneOf"].append({"type": "string"})
+        self.assertEqual(
+            NERModel.model_json_schema()["items"]["properties"]["entities"]["items"]["oneOf"], []
+        )
+
+    def test_unknown_schema_raises_attribute_error(self):
+        sf = SchemaFactory()
+        with self.assertRaises(AttributeError):
+            sf.unknown_schema
+        self.assertFalse(hasattr(sf, "unknown_schema"))
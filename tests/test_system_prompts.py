@@ -0,0 +1,96 @@
+import json
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from rhubarb.schema_factory import Entities
+from rhubarb.system_prompts import SystemPrompts, system_prompts
+from rhubarb.schema_factory.default_models import (
+    NERModel,
+    FigureModel,
+    DefaultModel,
+    MultiClassModel,
+    ClassificationModel,
+)
+
+CACHED_PROMPTS = [
+    "DefaultSysPrompt",
+    "SchemaSysPrompt",
+    "ChatSysPrompt",
+    "SummarySysPrompt",
+    "FigureSysPrompt",
+    "SchemaGenSysPrompt",
+    "SchemaGenSysPromptWithRephrase",
+    "ClassificationSysPrompt",
+    "MultiClassificationSysPrompt",
+]
+
+
+class FakeDatetime(datetime):
+    current = datetime(2024, 1, 31, 10, 0)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+class TestSystemPrompts(unittest.TestCase):
+    def setUp(self):
+        system_prompts._PROMPT_CACHE.clear()
+        system_prompts._DATE_CACHE[:] = [0.0, ""]
+        self.addCleanup(system_prompts._PROMPT_CACHE.clear)
+        self.addCleanup(system_prompts._DATE_CACHE.__setitem__, slice(None), [0.0, ""])
+
+    @patch("rhubarb.system_prompts.system_prompts.datetime", FakeDatetime)
+    @patch("rhubarb.system_prompts.system_prompts.time")
+    def test_date_rolls_over_at_midnight(self, mock_time):
+        FakeDatetime.current = datetime(2024, 1, 31, 10, 0)
+        mock_time.time.return_value = FakeDatetime.current.timestamp()
+        first = SystemPrompts().DefaultSysPrompt
+        self.assertIn("today's date is Jan-01-2024", first)
+
+        # the formatted date is reused until midnight
+        FakeDatetime.current = datetime(2024, 2, 1, 9, 0)
+        mock_time.time.return_value = datetime(2024, 1, 31, 23, 59).timestamp()
+        self.assertEqual(SystemPrompts().DefaultSysPrompt, first)
+
+        mock_time.time.return_value = FakeDatetime.current.timestamp()
+        second = SystemPrompts().DefaultSysPrompt
+        self.assertIn("today's date is Feb-02-2024", second)
+        self.assertNotEqual(second, first)
+
+    def test_cached_prompts_match_fresh_renders(self):
+        for streaming in (False, True):
+            for name in CACHED_PROMPTS:
+                with self.subTest(name=name, streaming=streaming):
+                    sp = SystemPrompts(streaming=streaming)
+                    fresh = getattr(SystemPrompts, name).fget.__wrapped__(sp)
+                    self.assertEqual(getattr(sp, name), fresh)
+                    # a second instance is served from the cache
+                    self.assertEqual(getattr(SystemPrompts(streaming=streaming), name), fresh)
+        # the streaming flag is part of the cache key
+        self.assertNotEqual(
+            SystemPrompts(streaming=False).ChatSysPrompt,
+            SystemPrompts(streaming=True).ChatSysPrompt,
+        )
+
+    def test_ner_prompt_matches_fresh_schema(self):
+        selections = [[Entities.PERSON], [Entities.ADDRESS, Entities.SSN], [Entities.PERSON]]
+        prompts = []
+        for entities in selections:
+            schema = BaseModel.model_json_schema.__func__(NERModel)
+            schema["items"]["properties"]["entities"]["items"]["oneOf"] = entities
+            prompt = SystemPrompts(entities=entities).NERSysPrompt
+            self.assertIn(json.dumps(schema), prompt)
+            prompts.append(prompt)
+        self.assertNotEqual(prompts[0], prompts[1])
+        self.assertEqual(prompts[0], prompts[2])
+
+    def test_memoized_model_schemas_match_fresh_schemas(self):
+        for model in (DefaultModel, FigureModel, ClassificationModel, MultiClassModel, NERModel):
+            with self.subTest(model=model.__name__):
+                fresh = BaseModel.model_json_schema.__func__(model)
+                self.assertEqual(model.model_json_schema(), fresh)
+                self.assertEqual(model.model_json_schema(), fresh)